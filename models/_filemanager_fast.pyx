@@ -0,0 +1,96 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Optional compiled helpers for FileManager's search hot loop.
+
+Build in place with `cythonize -i models/_filemanager_fast.pyx`. When the
+extension is not built, fileModel falls back to equivalent pure-Python code.
+"""
+
+from libc.string cimport memchr, strncasecmp
+
+cdef Py_ssize_t _sampleSize = 4096
+
+
+cdef inline unsigned char _lower(unsigned char c) nogil:
+    if 65 <= c <= 90:
+        return c + 32
+    return c
+
+
+def containsIgnoreCase(bytes haystack, bytes needle):
+    """
+    Returns True if the ASCII-lowercase needle occurs anywhere in haystack,
+    ignoring ASCII case, without allocating a lowered copy of the haystack.
+
+    The needle byte that is rarest in a sample of the haystack is used as the
+    anchor: memchr finds both cases of it and strncasecmp verifies each
+    candidate. The GIL is released while scanning. Inputs that still produce
+    too many candidates would degrade to O(n*m), so past a budget the rest of
+    the haystack is handed to bytes.lower().find, whose two-way search stays linear.
+    """
+    cdef const char* h = haystack
+    cdef const char* n = needle
+    cdef Py_ssize_t hayLen = len(haystack)
+    cdef Py_ssize_t needleLen = len(needle)
+    cdef Py_ssize_t budget = (hayLen >> 6) + 64
+    cdef Py_ssize_t counts[256]
+    cdef Py_ssize_t i, anchor = 0
+    cdef const char* start
+    cdef const char* end
+    cdef const char* pos
+    cdef const char* cand
+    cdef const char* lowerHit
+    cdef const char* upperHit = NULL
+    cdef unsigned char key, keyUpper
+    cdef bint found = False
+    cdef bint exhausted = False
+
+    if needleLen == 0:
+        return True
+    if needleLen > hayLen:
+        return False
+    if memchr(n, 0, needleLen) != NULL:
+        # strncasecmp stops at NUL bytes
+        return haystack.lower().find(needle) >= 0
+
+    with nogil:
+        for i in range(256):
+            counts[i] = 0
+        for i in range(min(hayLen, _sampleSize)):
+            counts[_lower(<unsigned char>h[i])] += 1
+        for i in range(1, needleLen):
+            if counts[<unsigned char>n[i]] < counts[<unsigned char>n[anchor]]:
+                anchor = i
+
+        key = <unsigned char>n[anchor]
+        keyUpper = key - 32 if 97 <= key <= 122 else key
+        # Window of positions where the anchor byte can sit in a full match
+        start = h + anchor
+        end = h + hayLen - needleLen + 1 + anchor
+        pos = start
+        lowerHit = <const char*>memchr(pos, key, end - pos)
+        if keyUpper != key:
+            upperHit = <const char*>memchr(pos, keyUpper, end - pos)
+        while lowerHit != NULL or upperHit != NULL:
+            if upperHit == NULL or (lowerHit != NULL and lowerHit < upperHit):
+                cand = lowerHit
+            else:
+                cand = upperHit
+            if strncasecmp(cand - anchor, n, needleLen) == 0:
+                found = True
+                break
+            budget -= 1
+            pos = cand + 1
+            if budget == 0:
+                exhausted = True
+                break
+            if pos >= end:
+                break
+            if cand == lowerHit:
+                lowerHit = <const char*>memchr(pos, key, end - pos)
+            else:
+                upperHit = <const char*>memchr(pos, keyUpper, end - pos)
+
+    if exhausted:
+        return haystack[pos - start:].lower().find(needle) >= 0
+    return found
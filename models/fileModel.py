@@ -1,84 +1,392 @@
+import calendar
+import codecs
+import fnmatch
 import json
+import os
+import re
 import shutil
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, BinaryIO, Hashable, Iterable, Iterator, Optional, Tuple
 from datetime import datetime
+from stat import S_ISDIR, S_ISLNK, S_ISREG
 
-class FileManager:
-    def __init__(self):
-        pass
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-    def _safeRead(self, filePath: Path) -> str:
-        encodings = ['utf-8', 'latin-1', 'cp1252']
-        for encoding in encodings:
+try:
+    import charset_normalizer
+except ImportError:
+    charset_normalizer = None
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def _pyContainsIgnoreCase(haystack: bytes, needle: bytes) -> bool:
+    return haystack.lower().find(needle) >= 0
+
+
+try:
+    from models._filemanager_fast import containsIgnoreCase
+except ImportError:
+    containsIgnoreCase = _pyContainsIgnoreCase
+
+
+# orjson parses integers wider than 64 bits as floats, so documents containing long digit
+# runs go through the stdlib parser, which keeps them exact
+_longDigitRun = re.compile(rb'\d{19}')
+
+
+def _hasNonFinite(data: Any) -> bool:
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if item != item or item in (float('inf'), float('-inf')):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return False
+
+
+def dumpJson(data: Any) -> bytes:
+    """
+    Serializes data to indented UTF-8 JSON, using orjson when it is installed.
+    Falls back to the stdlib for anything orjson would reject or alter: integers
+    beyond 64 bits, and NaN/Infinity, which orjson silently writes as null.
+    """
+    if orjson is not None:
+        try:
+            raw = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass
+        else:
+            if b'null' not in raw or not _hasNonFinite(data):
+                return raw
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def loadJson(raw: bytes) -> Any:
+    """
+    Parses JSON from bytes, using orjson when it is installed. Documents with
+    integers too wide for orjson, or that orjson rejects (e.g. NaN), are parsed
+    with the stdlib instead so values are never rounded or lost.
+    """
+    if orjson is not None and not _longDigitRun.search(raw):
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+class FileManager:
+    cacheSize = 1024
+    cacheMaxBytes = 64 << 20
+    cacheMaxEntryBytes = 4 << 20
+    minDetectLength = 32
+    # UTF-32 first: its little-endian BOM starts with the UTF-16 one
+    _unicodeBoms = (
+        (codecs.BOM_UTF32_LE, 'utf-32'), (codecs.BOM_UTF32_BE, 'utf-32'),
+        (codecs.BOM_UTF16_LE, 'utf-16'), (codecs.BOM_UTF16_BE, 'utf-16'),
+    )
+    chunkedScanThreshold = 1 << 20
+    scanChunkSize = 1 << 20
+    largeFileThreshold = 64 << 20
+    copyChunkSize = 16 << 20
+    appendHandleLimit = 64
+    vectorizeThreshold = 1000
+    offsetSampleStep = 7 * 86400
+    maxSearchSize = 50 << 20
+    binarySniffSize = 8192
+    binaryExtensions = frozenset({
+        '.png', '.jpg', '.jpeg', '.gif', '.bmp', '.ico', '.webp', '.pdf',
+        '.zip', '.gz', '.tgz', '.bz2', '.xz', '.7z', '.rar', '.jar', '.whl',
+        '.mp3', '.mp4', '.mov', '.avi', '.mkv', '.wav', '.flac', '.ogg',
+        '.exe', '.dll', '.so', '.dylib', '.o', '.a', '.bin', '.class', '.pyc',
+        '.woff', '.woff2', '.ttf', '.otf', '.sqlite', '.db'
+    })
+
+    defaultIgnoredDirs = frozenset({'.git', '.hg', '.svn', 'node_modules', '__pycache__'})
+
+    def __init__(self, ignoredDirs: Optional[Iterable[str]] = None):
+        # Directory names findFiles/searchInFiles never descend into; pass an empty set to walk everything
+        self.ignoredDirs = self.defaultIgnoredDirs if ignoredDirs is None else frozenset(ignoredDirs)
+        # LRU of parsed JSON and file info, keyed by path and stat so edits invalidate entries
+        self._cache: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        self._cacheBytes = 0
+        self._cacheLock = threading.Lock()
+        # LRU of open append handles so repeated appends skip the open/close per call
+        self._appendHandles: "OrderedDict[str, BinaryIO]" = OrderedDict()
+        self._appendLock = threading.Lock()
+        # Closes leftover handles when the manager is collected or at interpreter exit,
+        # without keeping the manager itself alive
+        weakref.finalize(self, self._closeHandles, self._appendHandles)
+
+    def _statKey(self, kind: str, targetPath: Path, stat: os.stat_result) -> Hashable:
+        return (kind, str(targetPath), stat.st_mtime_ns, stat.st_ctime_ns, stat.st_size)
+
+    def _cacheGet(self, key: Hashable) -> Any:
+        with self._cacheLock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            self._cache.move_to_end(key)
+            return entry[0]
+
+    def _cachePut(self, key: Hashable, value: Any, size: int) -> None:
+        if size > self.cacheMaxEntryBytes:
+            return
+        with self._cacheLock:
+            previous = self._cache.pop(key, None)
+            if previous is not None:
+                self._cacheBytes -= previous[1]
+            self._cache[key] = (value, size)
+            self._cacheBytes += size
+            while len(self._cache) > self.cacheSize or self._cacheBytes > self.cacheMaxBytes:
+                _, (_, evictedSize) = self._cache.popitem(last=False)
+                self._cacheBytes -= evictedSize
+
+    def _normPath(self, filePath: str) -> Path:
+        # Lexical normalization only; resolve() would readlink every path component
+        return Path(os.path.abspath(filePath))
+
+    def _detectEncoding(self, raw: bytes) -> Optional[str]:
+        if charset_normalizer is None or len(raw) < self.minDetectLength:
+            # Too little text to tell code pages apart; guesses here are mostly wrong
+            return None
+        best = charset_normalizer.from_bytes(raw).best()
+        if best is None:
+            return None
+        if best.encoding.startswith(('utf_16', 'utf_32')) and not best.bom:
+            # Without a BOM these are almost always misreads of 8-bit text
+            return None
+        return best.encoding
+
+    def _safeDecode(self, raw: bytes, filePath: Path) -> str:
+        if raw.startswith(b'\xef\xbb\xbf'):
+            return raw.decode('utf-8-sig')
+        try:
+            return raw.decode('utf-8')
+        except UnicodeDecodeError:
+            pass
+        for bom, encoding in self._unicodeBoms:
+            if raw.startswith(bom):
+                try:
+                    return raw.decode(encoding)
+                except UnicodeDecodeError:
+                    break
+        detected = self._detectEncoding(raw)
+        # latin-1 maps every byte, so it is a lossless last resort
+        for encoding in ([detected] if detected else []) + ['cp1252', 'latin-1']:
             try:
-                return filePath.read_text(encoding=encoding)
-            except UnicodeDecodeError:
+                return raw.decode(encoding)
+            except (UnicodeDecodeError, LookupError):
                 continue
-        raise UnicodeDecodeError(f"Cannot decode file: {filePath}")
+        raise ValueError(f"Cannot decode file: {filePath}")
+
+    def _safeRead(self, filePath: Path) -> str:
+        return self._safeDecode(filePath.read_bytes(), filePath)
 
     def readFile(self, filePath: str) -> Dict[str, Any]:
-        targetPath = Path(filePath).resolve()
-        if not targetPath.exists():
-            return {"success": False, "error": f"File does not exist: {filePath}"}
+        targetPath = self._normPath(filePath)
 
         try:
-            content = self._safeRead(targetPath)
-            return {"success": True, "content": content, "size": len(content.encode('utf-8'))}
+            raw = targetPath.read_bytes()
+            content = self._safeDecode(raw, targetPath)
+            return {"success": True, "content": content, "size": len(raw)}
+        except FileNotFoundError:
+            return {"success": False, "error": f"File does not exist: {filePath}"}
         except Exception as e:
             return {"success": False, "error": str(e)}
 
-    def writeFile(self, filePath: str, content: str, overwrite: bool = True) -> Dict[str, Any]:
-        targetPath = Path(filePath).resolve()
+    def _writeBytes(self, filePath: str, raw: bytes, overwrite: bool) -> Dict[str, Any]:
+        targetPath = self._normPath(filePath)
 
         if targetPath.exists() and not overwrite:
             return {"success": False, "error": f"File exists and overwrite=False: {filePath}"}
 
         try:
             targetPath.parent.mkdir(parents=True, exist_ok=True)
-            targetPath.write_text(content, encoding='utf-8')
-            bytesWritten = len(content.encode('utf-8'))
-            return {"success": True, "bytesWritten": bytesWritten, "path": str(targetPath)}
+            targetPath.write_bytes(raw)
+            return {"success": True, "bytesWritten": len(raw), "path": str(targetPath)}
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    def writeFile(self, filePath: str, content: str, overwrite: bool = True) -> Dict[str, Any]:
+        try:
+            raw = content.encode('utf-8')
         except Exception as e:
             return {"success": False, "error": str(e)}
+        return self._writeBytes(filePath, raw, overwrite)
+
+    def _appendHandle(self, targetPath: Path) -> BinaryIO:
+        key = str(targetPath)
+        handle = self._appendHandles.get(key)
+        if handle is not None:
+            try:
+                # Reuse only while the path still names the file the handle was opened on
+                if os.path.samestat(os.stat(key), os.fstat(handle.fileno())):
+                    self._appendHandles.move_to_end(key)
+                    return handle
+            except FileNotFoundError:
+                pass
+            del self._appendHandles[key]
+            handle.close()
+
+        targetPath.parent.mkdir(parents=True, exist_ok=True)
+        handle = open(targetPath, 'ab')
+        self._appendHandles[key] = handle
+        if len(self._appendHandles) > self.appendHandleLimit:
+            _, oldest = self._appendHandles.popitem(last=False)
+            oldest.close()
+        return handle
+
+    @staticmethod
+    def _closeHandles(handles: "OrderedDict[str, BinaryIO]") -> None:
+        while handles:
+            _, handle = handles.popitem()
+            handle.close()
+
+    def _closeAppendHandles(self, underPath: Path) -> None:
+        with self._appendLock:
+            prefix = str(underPath)
+            for key in list(self._appendHandles):
+                if key == prefix or key.startswith(os.path.join(prefix, '')):
+                    self._appendHandles.pop(key).close()
 
     def appendFile(self, filePath: str, content: str) -> Dict[str, Any]:
-        targetPath = Path(filePath).resolve()
+        targetPath = self._normPath(filePath)
 
         try:
-            targetPath.parent.mkdir(parents=True, exist_ok=True)
-            with open(targetPath, 'a', encoding='utf-8') as f:
-                f.write(content)
-            bytesAppended = len(content.encode('utf-8'))
-            return {"success": True, "bytesAppended": bytesAppended, "path": str(targetPath)}
+            raw = content.encode('utf-8')
+            with self._appendLock:
+                handle = self._appendHandle(targetPath)
+                handle.write(raw)
+                handle.flush()
+            return {"success": True, "bytesAppended": len(raw), "path": str(targetPath)}
         except Exception as e:
             return {"success": False, "error": str(e)}
 
     def deleteFile(self, filePath: str) -> Dict[str, Any]:
-        targetPath = Path(filePath).resolve()
+        targetPath = self._normPath(filePath)
 
-        if not targetPath.exists():
+        try:
+            fileStat = os.lstat(targetPath)
+        except FileNotFoundError:
             return {"success": False, "error": f"File does not exist: {filePath}"}
 
-        if targetPath.is_dir():
+        if S_ISDIR(fileStat.st_mode):
             return {"success": False, "error": f"Use deleteFolder for directories: {filePath}"}
 
         try:
+            self._closeAppendHandles(targetPath)
             targetPath.unlink()
             return {"success": True, "deleted": str(targetPath)}
         except Exception as e:
             return {"success": False, "error": str(e)}
 
-    def copyFile(self, sourcePath: str, destPath: str) -> Dict[str, Any]:
+    def _openNoAtime(self, filePath: Path) -> int:
+        try:
+            return os.open(filePath, os.O_RDONLY | getattr(os, 'O_NOATIME', 0))
+        except PermissionError:
+            # O_NOATIME is only allowed for the file's owner
+            return os.open(filePath, os.O_RDONLY)
+
+    def _copyFds(self, srcFd: int, dstFd: int, size: int) -> int:
+        # In-kernel copy; copy_file_range lets filesystems like Btrfs/XFS share extents,
+        # sendfile covers kernels or filesystem pairs where that is unsupported
+        copiers = []
+        if hasattr(os, 'copy_file_range'):
+            copiers.append(lambda: os.copy_file_range(srcFd, dstFd, self.copyChunkSize))
+        copiers.append(lambda: os.sendfile(dstFd, srcFd, None, self.copyChunkSize))
+
+        for copier in copiers:
+            copied = 0
+            try:
+                while True:
+                    n = copier()
+                    if n == 0:
+                        break
+                    copied += n
+            except OSError:
+                if copied:
+                    raise
+                continue
+            # procfs/sysfs and some FUSE/NFS pairs report 0 without copying anything,
+            # so an empty first result means "try the next copier", as in shutil
+            if copied:
+                return copied
+
+        with open(srcFd, 'rb', closefd=False) as fsrc, open(dstFd, 'wb', closefd=False) as fdst:
+            copied = 0
+            while True:
+                chunk = fsrc.read(self.copyChunkSize)
+                if not chunk:
+                    return copied
+                fdst.write(chunk)
+                copied += len(chunk)
+
+    def _copyContent(self, source: Path, dest: Path, size: int) -> None:
+        if not sys.platform.startswith('linux') or (os.path.exists(dest) and os.path.samefile(source, dest)):
+            shutil.copyfile(source, dest)
+            return
+
+        srcFd = self._openNoAtime(source)
+        try:
+            dstFd = os.open(dest, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+            try:
+                copied = self._copyFds(srcFd, dstFd, size)
+                # procfs/sysfs sizes are nominal, so a copy is only short if the source
+                # still has data past what was copied
+                if copied < size and os.pread(srcFd, 1, copied):
+                    raise OSError(f"Copied {copied} of {size} bytes from {source}")
+                if size > self.largeFileThreshold:
+                    # Drop the copied pages so a bulk copy doesn't flush the rest of the page cache
+                    os.posix_fadvise(srcFd, 0, 0, os.POSIX_FADV_DONTNEED)
+                    os.posix_fadvise(dstFd, 0, 0, os.POSIX_FADV_DONTNEED)
+            finally:
+                os.close(dstFd)
+        finally:
+            os.close(srcFd)
+
+    def copyFile(self, sourcePath: str, destPath: str, preserveMetadata: bool = True) -> Dict[str, Any]:
         source = Path(sourcePath).resolve()
         dest = Path(destPath).resolve()
 
-        if not source.exists():
+        try:
+            sourceStat = os.stat(source)
+        except FileNotFoundError:
             return {"success": False, "error": f"Source file does not exist: {sourcePath}"}
 
         try:
             dest.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(source, dest)
+            if not S_ISREG(sourceStat.st_mode):
+                # Directories, FIFOs and devices: shutil rejects them before touching dest,
+                # where the raw-fd path would block on a FIFO or leave an empty dest behind
+                if preserveMetadata:
+                    shutil.copy2(source, dest)
+                else:
+                    shutil.copyfile(source, dest)
+            elif preserveMetadata and sourceStat.st_size <= self.largeFileThreshold:
+                shutil.copy2(source, dest)
+            else:
+                if dest.is_dir():
+                    dest = dest / source.name
+                self._copyContent(source, dest, sourceStat.st_size)
+                if preserveMetadata:
+                    shutil.copystat(source, dest)
             return {"success": True, "copiedFrom": str(source), "copiedTo": str(dest)}
         except Exception as e:
             return {"success": False, "error": str(e)}
@@ -92,64 +400,166 @@ class FileManager:
 
         try:
             dest.parent.mkdir(parents=True, exist_ok=True)
+            # Append handles are keyed by the lexical path appendFile uses, not the resolved one
+            for handlePath in {self._normPath(sourcePath), self._normPath(destPath), source, dest}:
+                self._closeAppendHandles(handlePath)
             shutil.move(str(source), str(dest))
             return {"success": True, "movedFrom": str(source), "movedTo": str(dest)}
         except Exception as e:
             return {"success": False, "error": str(e)}
 
-    def getFileInfo(self, filePath: str) -> Dict[str, Any]:
-        targetPath = Path(filePath).resolve()
+    def _fileInfoEntry(self, targetPath: Path, fileStat: os.stat_result) -> Tuple[Dict[str, Any], bytes]:
+        key = self._statKey("info", targetPath, fileStat)
+        entry = self._cacheGet(key)
+        if entry is None:
+            info = {
+                "path": str(targetPath),
+                "size": fileStat.st_size,
+                "modified": datetime.fromtimestamp(fileStat.st_mtime).isoformat(),
+                "created": datetime.fromtimestamp(fileStat.st_ctime).isoformat(),
+                "isDir": S_ISDIR(fileStat.st_mode),
+                "isFile": S_ISREG(fileStat.st_mode),
+                "extension": targetPath.suffix
+            }
+            # The serialized form is cached alongside the dict so it is only encoded once
+            entry = (info, dumpJson(info))
+            self._cachePut(key, entry, len(entry[1]))
+        return entry
 
-        if not targetPath.exists():
+    def _fileInfoResult(self, filePath: str, asJson: bool) -> Dict[str, Any]:
+        targetPath = self._normPath(filePath)
+
+        try:
+            fileStat = os.stat(targetPath)
+        except FileNotFoundError:
             return {"success": False, "error": f"File does not exist: {filePath}"}
 
         try:
-            stat = targetPath.stat()
-            return {
-                "success": True,
-                "path": str(targetPath),
-                "size": stat.st_size,
-                "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                "created": datetime.fromtimestamp(stat.st_ctime).isoformat(),
-                "isDir": targetPath.is_dir(),
-                "isFile": targetPath.is_file(),
-                "extension": targetPath.suffix
-            }
+            info, infoJson = self._fileInfoEntry(targetPath, fileStat)
+            if asJson:
+                return {"success": True, "json": infoJson}
+            return {"success": True, **info}
         except Exception as e:
             return {"success": False, "error": str(e)}
 
+    def getFileInfo(self, filePath: str) -> Dict[str, Any]:
+        return self._fileInfoResult(filePath, asJson=False)
+
+    def getFileInfoJson(self, filePath: str) -> Dict[str, Any]:
+        return self._fileInfoResult(filePath, asJson=True)
+
     def writeJsonFile(self, filePath: str, data: dict, overwrite: bool = True) -> Dict[str, Any]:
         try:
-            jsonContent = json.dumps(data, indent=2, ensure_ascii=False)
-            return self.writeFile(filePath, jsonContent, overwrite)
+            raw = dumpJson(data)
         except Exception as e:
             return {"success": False, "error": f"Failed to serialize JSON: {str(e)}"}
+        return self._writeBytes(filePath, raw, overwrite)
 
     def readJsonFile(self, filePath: str) -> Dict[str, Any]:
-        result = self.readFile(filePath)
-        if not result["success"]:
-            return result
+        targetPath = self._normPath(filePath)
 
         try:
-            data = json.loads(result["content"])
+            key = self._statKey("json", targetPath, targetPath.stat())
+            # Only the validated bytes are cached; parsing on every call gives each caller its own objects
+            raw = self._cacheGet(key)
+            cached = raw is not None
+            if not cached:
+                raw = targetPath.read_bytes()
+            data = loadJson(raw)
+            if not cached:
+                self._cachePut(key, raw, len(raw))
             return {"success": True, "data": data}
-        except json.JSONDecodeError as e:
+        except FileNotFoundError:
+            return {"success": False, "error": f"File does not exist: {filePath}"}
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
             return {"success": False, "error": f"Invalid JSON: {str(e)}"}
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    def readJsonFileRaw(self, filePath: str) -> Dict[str, Any]:
+        targetPath = self._normPath(filePath)
+
+        try:
+            key = self._statKey("json", targetPath, targetPath.stat())
+            raw = self._cacheGet(key)
+            if raw is None:
+                raw = targetPath.read_bytes()
+                # Validate by parsing once; the bytes are cached for readJsonFile to reuse
+                loadJson(raw)
+                self._cachePut(key, raw, len(raw))
+            # Same detection json.loads applies to bytes: UTF-8 (BOM stripped), UTF-16 or UTF-32
+            content = raw.decode(json.detect_encoding(raw))
+            return {"success": True, "content": content}
+        except FileNotFoundError:
+            return {"success": False, "error": f"File does not exist: {filePath}"}
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            return {"success": False, "error": f"Invalid JSON: {str(e)}"}
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    def _utcOffset(self, seconds: int) -> int:
+        return calendar.timegm(time.localtime(seconds)) - seconds
+
+    def _offsetTransitions(self, first: int, last: int) -> Tuple[List[int], List[int]]:
+        # Sample the local UTC offset weekly and bisect each change down to the exact second
+        transitions, offsets = [], [self._utcOffset(first)]
+        lo = first
+        while lo < last:
+            hi = min(lo + self.offsetSampleStep, last)
+            if self._utcOffset(hi) != offsets[-1]:
+                while hi - lo > 1:
+                    mid = (lo + hi) // 2
+                    if self._utcOffset(mid) == offsets[-1]:
+                        lo = mid
+                    else:
+                        hi = mid
+                transitions.append(hi)
+                offsets.append(self._utcOffset(hi))
+            lo = hi
+        return transitions, offsets
+
+    def _formatDates(self, mtimes: List[float]) -> List[str]:
+        if numpy is not None and len(mtimes) >= self.vectorizeThreshold:
+            seconds = numpy.floor(numpy.asarray(mtimes, dtype='float64')).astype('int64')
+            first, last = int(seconds.min()), int(seconds.max())
+            # Offset sampling costs one localtime call per week of span; only worth it while
+            # that stays well below one call per entry
+            if (last - first) // self.offsetSampleStep < len(mtimes) // 4:
+                transitions, offsets = self._offsetTransitions(first, last)
+                index = numpy.searchsorted(numpy.asarray(transitions, dtype='int64'), seconds, side='right')
+                local = (seconds + numpy.asarray(offsets, dtype='int64')[index]).astype('datetime64[s]')
+                return local.astype('datetime64[D]').astype(str).tolist()
+        return [datetime.fromtimestamp(m).date().isoformat() for m in mtimes]
 
     def listDirectory(self, path: str) -> Dict[str, Any]:
-        targetPath = Path(path).resolve()
+        targetPath = self._normPath(path)
 
         if not targetPath.exists():
             return {"success": False, "error": f"Path does not exist: {path}"}
 
         try:
+            with os.scandir(targetPath) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+
+            types, sizes, mtimes = [], [], []
+            for entry in entries:
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    # Dangling symlink: describe the link itself rather than failing the listing
+                    stat = entry.stat(follow_symlinks=False)
+                types.append("dir" if entry.is_dir() else "file")
+                sizes.append(stat.st_size if entry.is_file() else 0)
+                mtimes.append(stat.st_mtime)
+
             items = []
-            for item in sorted(targetPath.iterdir()):
+            for entry, itemType, size, modified in zip(entries, types, sizes, self._formatDates(mtimes)):
                 itemInfo = {
-                    "name": item.name,
-                    "type": "dir" if item.is_dir() else "file",
-                    "size": item.stat().st_size if item.is_file() else 0,
-                    "path": str(item)
+                    "name": entry.name,
+                    "type": itemType,
+                    "size": size,
+                    "modified": modified,
+                    "path": entry.path
                 }
                 items.append(itemInfo)
 
@@ -158,7 +568,7 @@ class FileManager:
             return {"success": False, "error": str(e)}
 
     def createFolder(self, folderPath: str) -> Dict[str, Any]:
-        targetPath = Path(folderPath).resolve()
+        targetPath = self._normPath(folderPath)
 
         try:
             targetPath.mkdir(parents=True, exist_ok=True)
@@ -167,15 +577,22 @@ class FileManager:
             return {"success": False, "error": str(e)}
 
     def deleteFolder(self, folderPath: str, recursive: bool = False) -> Dict[str, Any]:
-        targetPath = Path(folderPath).resolve()
+        targetPath = self._normPath(folderPath)
 
-        if not targetPath.exists():
+        try:
+            folderStat = os.lstat(targetPath)
+        except FileNotFoundError:
             return {"success": False, "error": f"Folder does not exist: {folderPath}"}
 
-        if not targetPath.is_dir():
+        if S_ISLNK(folderStat.st_mode):
+            # Never follow the link into its target; deleteFile removes the link itself
+            return {"success": False, "error": f"Is a symlink, use deleteFile to remove the link: {folderPath}"}
+
+        if not S_ISDIR(folderStat.st_mode):
             return {"success": False, "error": f"Not a directory: {folderPath}"}
 
         try:
+            self._closeAppendHandles(targetPath)
             if recursive:
                 shutil.rmtree(targetPath)
                 return {"success": True, "deleted": str(targetPath), "recursive": True}
@@ -187,47 +604,158 @@ class FileManager:
                 return {"success": False, "error": f"Directory not empty: {folderPath}"}
             return {"success": False, "error": str(e)}
 
-    def findFiles(self, pattern: str, path: str) -> Dict[str, Any]:
-        targetPath = Path(path).resolve()
+    def _globRegex(self, pattern: str) -> "re.Pattern[str]":
+        # Same semantics as Path.rglob: the pattern may start at any depth and a
+        # "**" segment spans zero or more directories; other wildcards stay within a segment
+        parts = []
+        segments = []
+        for segment in pattern.replace(os.sep, '/').strip('/').split('/'):
+            if segment != '**' or segments[-1:] != ['**']:
+                segments.append(segment)
+        for i, segment in enumerate(segments):
+            last = i == len(segments) - 1
+            if segment == '**':
+                if not last:
+                    parts.append('(?:[^/]*/)*')
+                elif parts and parts[-1] == '/':
+                    parts[-1] = '(?:/.*)?'
+                else:
+                    parts.append('.*')
+                continue
+            j = 0
+            while j < len(segment):
+                c = segment[j]
+                j += 1
+                if c == '*':
+                    parts.append('[^/]*')
+                elif c == '?':
+                    parts.append('[^/]')
+                elif c == '[':
+                    k = j + 1 if segment[j:j + 1] == '!' else j
+                    k = k + 1 if segment[k:k + 1] == ']' else k
+                    end = segment.find(']', k)
+                    if end < 0:
+                        parts.append('\\[')
+                        continue
+                    body = segment[j:end].replace('\\', '\\\\').replace('[', '\\[')
+                    if body.startswith('!'):
+                        body = '^' + body[1:]
+                    elif body.startswith('^'):
+                        body = '\\' + body
+                    parts.append('[' + body + ']')
+                    j = end + 1
+                else:
+                    parts.append(re.escape(c))
+            if not last:
+                parts.append('/')
+        flags = re.IGNORECASE if os.path.normcase('A') == 'a' else 0
+        return re.compile('(?s:(?:.*/)?' + ''.join(parts) + r')\Z', flags)
+
+    def _iterMatches(self, root: Path, pattern: str, includeIgnored: bool = False) -> Iterator[os.DirEntry]:
+        rootPrefix = len(os.path.join(str(root), ''))
+        ignoredDirs = frozenset() if includeIgnored else self.ignoredDirs
+        if '/' in pattern or os.sep in pattern or '**' in pattern:
+            # Patterns spanning directories are matched against the whole relative path
+            regex = self._globRegex(pattern)
+            # Like rglob, a trailing "**" selects directories only
+            dirsOnly = pattern.replace(os.sep, '/').rstrip('/').endswith('**')
+            matches = lambda entry: (regex.match(entry.path[rootPrefix:].replace(os.sep, '/'))
+                                     and (not dirsOnly or entry.is_dir()))
+        else:
+            flags = re.IGNORECASE if os.path.normcase('A') == 'a' else 0
+            regex = re.compile(fnmatch.translate(pattern), flags)
+            matches = lambda entry: regex.match(entry.name)
+
+        stack = [str(root)]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        if matches(entry):
+                            yield entry
+                        if entry.is_dir(follow_symlinks=False) and entry.name not in ignoredDirs:
+                            stack.append(entry.path)
+            except OSError:
+                continue
+
+    def findFiles(self, pattern: str, path: str, includeIgnored: bool = False) -> Dict[str, Any]:
+        targetPath = self._normPath(path)
 
         if not targetPath.exists():
             return {"success": False, "error": f"Path does not exist: {path}"}
 
         try:
-            matches = list(targetPath.rglob(pattern))
             results = []
-            for match in matches:
+            for entry in self._iterMatches(targetPath, pattern, includeIgnored):
                 results.append({
-                    "path": str(match),
-                    "name": match.name,
-                    "type": "dir" if match.is_dir() else "file",
-                    "size": match.stat().st_size if match.is_file() else 0
+                    "path": entry.path,
+                    "name": entry.name,
+                    "type": "dir" if entry.is_dir() else "file",
+                    "size": entry.stat().st_size if entry.is_file() else 0
                 })
 
             return {"success": True, "matches": results, "count": len(results)}
         except Exception as e:
             return {"success": False, "error": str(e)}
 
-    def searchInFiles(self, searchTerm: str, filePattern: str, path: str) -> Dict[str, Any]:
-        targetPath = Path(path).resolve()
+    def _scanChunked(self, f: Any, needleBytes: bytes) -> bool:
+        # Reads overlapping chunks so memory use stays bounded; unlike an mmap, a file
+        # truncated mid-scan (e.g. by log rotation) just ends the read instead of raising SIGBUS
+        overlap = len(needleBytes) - 1
+        tail = b''
+        f.seek(0)
+        while True:
+            chunk = f.read(self.scanChunkSize)
+            if not chunk:
+                return False
+            window = tail + chunk
+            if containsIgnoreCase(window, needleBytes):
+                return True
+            tail = window[len(window) - overlap:] if overlap else b''
+
+    def _scanFile(self, filePath: Path, needle: str, needleBytes: bytes) -> Optional[Dict[str, str]]:
+        try:
+            with open(filePath, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size > self.maxSearchSize:
+                    return None
+                # NUL bytes near the start mark a binary file, the same heuristic git uses
+                head = f.read(self.binarySniffSize)
+                if b'\x00' in head:
+                    return None
+                if size > self.chunkedScanThreshold and needleBytes.isascii():
+                    # An ASCII term only ever matches ASCII bytes, so large files need no decoding
+                    found = self._scanChunked(f, needleBytes)
+                else:
+                    raw = head + f.read() if len(head) == self.binarySniffSize else head
+                    if raw.isascii():
+                        # Pure ASCII content: search the bytes case-insensitively without decoding
+                        found = containsIgnoreCase(raw, needleBytes)
+                    else:
+                        found = self._safeDecode(raw, filePath).lower().find(needle) >= 0
+        except Exception:
+            return None
+        if found:
+            return {"file": str(filePath), "name": filePath.name}
+        return None
+
+    def searchInFiles(self, searchTerm: str, filePattern: str, path: str, includeIgnored: bool = False) -> Dict[str, Any]:
+        targetPath = self._normPath(path)
 
         if not targetPath.exists():
             return {"success": False, "error": f"Path does not exist: {path}"}
 
         try:
-            matches = []
-
-            for filePath in targetPath.rglob(filePattern):
-                if filePath.is_file():
-                    try:
-                        content = self._safeRead(filePath)
-                        if searchTerm.lower() in content.lower():
-                            matches.append({
-                                "file": str(filePath),
-                                "name": filePath.name
-                            })
-                    except:
-                        continue
+            candidates = [Path(entry.path) for entry in self._iterMatches(targetPath, filePattern, includeIgnored)
+                          if entry.is_file() and os.path.splitext(entry.name)[1].lower() not in self.binaryExtensions]
+            needle = searchTerm.lower()
+            needleBytes = needle.encode('utf-8')
+            workers = min(32, (os.cpu_count() or 1) * 4)
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = executor.map(lambda p: self._scanFile(p, needle, needleBytes), candidates)
+                matches = [match for match in results if match]
 
             return {"success": True, "files": matches, "count": len(matches)}
         except Exception as e: